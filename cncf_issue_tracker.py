@@ -7,11 +7,16 @@ Optimized for Railway/Render deployment.
 
 import os
 import asyncio
+import html
+import json
 import logging
+import random
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 import aiohttp
-import sqlite3
+import orjson
 from dataclasses import dataclass, field
 
 # Configuration
@@ -19,11 +24,9 @@ try:
     from config import (
         REPOSITORIES,
         DEFAULT_CHECK_INTERVAL,
-        DATABASE_PATH,
+        STATE_PATH,
         LOG_LEVEL,
-        BATCH_SIZE,
-        BATCH_DELAY,
-        NOTIFICATION_DELAY,
+        CONCURRENCY,
         API_TIMEOUT,
         CHECK_BUFFER_MINUTES,
     )
@@ -41,18 +44,18 @@ except ImportError:
         "antrea-io/antrea-ui",
         "antrea-io/antrea "
     ]
+    # Strip whitespace and drop duplicates (keeps order) so no repository is polled twice
+    REPOSITORIES = list(dict.fromkeys(r.strip() for r in REPOSITORIES if r.strip()))
     DEFAULT_CHECK_INTERVAL = 180
-    DATABASE_PATH = "cncf_issues.db"
+    STATE_PATH = "state.json"
     LOG_LEVEL = "INFO"
-    BATCH_SIZE = 3
-    BATCH_DELAY = 2
-    NOTIFICATION_DELAY = 1
+    CONCURRENCY = 5
     API_TIMEOUT = 10
     CHECK_BUFFER_MINUTES = 2
 
 
-def resolve_default_db_path(default_path: str) -> str:
-    """Select a safe database path for Railway or local runs.
+def resolve_default_state_path(default_path: str) -> str:
+    """Select a safe state file path for Railway or local runs.
 
     Preference order:
     1) /data (Railway persistent disk if mounted)
@@ -61,13 +64,20 @@ def resolve_default_db_path(default_path: str) -> str:
     """
     try:
         if os.path.isdir("/data"):
-            return "/data/cncf_issues.db"
+            return "/data/state.json"
         if os.path.isdir("/tmp"):
-            return "/tmp/cncf_issues.db"
+            return "/tmp/state.json"
     except Exception:
         pass
     return default_path
 
+def create_session(timeout_seconds: int) -> aiohttp.ClientSession:
+    """Create a pooled HTTP session so connections to GitHub/Telegram are reused."""
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=timeout_seconds),
+        connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=75),
+    )
+
 @dataclass
 class Config:
     github_token: str = os.getenv('GITHUB_TOKEN', '')
@@ -75,12 +85,10 @@ class Config:
     telegram_bot_token: str = os.getenv('TELEGRAM_BOT_TOKEN', '')
     telegram_chat_id: str = os.getenv('TELEGRAM_CHAT_ID', '')
     check_interval: int = int(os.getenv('CHECK_INTERVAL', str(DEFAULT_CHECK_INTERVAL)))
-    db_path: str = os.getenv('DB_PATH', resolve_default_db_path(DATABASE_PATH))
+    state_path: str = os.getenv('STATE_PATH', resolve_default_state_path(STATE_PATH))
     repositories: List[str] = field(default_factory=list)
     log_level: str = os.getenv('LOG_LEVEL', LOG_LEVEL)
-    batch_size: int = int(os.getenv('BATCH_SIZE', str(BATCH_SIZE)))
-    batch_delay: int = int(os.getenv('BATCH_DELAY', str(BATCH_DELAY)))
-    notification_delay: int = int(os.getenv('NOTIFICATION_DELAY', str(NOTIFICATION_DELAY)))
+    concurrency: int = int(os.getenv('CONCURRENCY', str(CONCURRENCY)))
     api_timeout: int = int(os.getenv('API_TIMEOUT', str(API_TIMEOUT)))
     check_buffer_minutes: int = int(os.getenv('CHECK_BUFFER_MINUTES', str(CHECK_BUFFER_MINUTES)))
 
@@ -89,7 +97,7 @@ class Config:
         if not self.repositories:
             self.repositories = list(REPOSITORIES)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Issue:
     id: int
     number: int
@@ -98,65 +106,125 @@ class Issue:
     created_at: str
     repository: str
     author: str
-    labels: List[str]
+    labels: Tuple[str, ...]
 
-class Database:
-    def __init__(self, db_path: str):
-        self.db_path = db_path
-        self.init_db()
+class StateStore:
+    """Tracked-issue set kept in memory and persisted as a JSON snapshot plus an append-only log.
+
+    Each newly tracked issue is appended to the log as ``repository<TAB>issue_id``.
+    On startup the snapshot is loaded, the log replayed, and both folded back
+    into a fresh snapshot; the same compaction runs once the log grows large.
+    """
+    COMPACT_THRESHOLD = 1000
     
-    def init_db(self):
-        """Initialize the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tracked_issues (
-                issue_id INTEGER,
-                repository TEXT,
-                created_at TEXT,
-                tracked_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                PRIMARY KEY (issue_id, repository)
-            )
-        ''')
+    def __init__(self, state_path: str):
+        self.state_path = state_path
+        self.log_path = os.path.splitext(state_path)[0] + '.log'
+        self._lock = threading.Lock()
+        self.seen: Set[Tuple[str, int]] = set()
+        self._log = None
+        self._log_entries = 0
+        self._load()
+        self.compact()
+    
+    def _load(self):
+        """Load the snapshot and replay the append-only log."""
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                self.seen = {(repo, int(issue_id)) for repo, issue_id in json.load(f)}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f"State snapshot error: {e}")
         
-        conn.commit()
-        conn.close()
+        try:
+            with open(self.log_path, encoding='utf-8') as f:
+                for line in f:
+                    repo, sep, issue_id = line.rstrip('\n').rpartition('\t')
+                    if sep and issue_id.isdigit():  # Skip a torn final line
+                        self.seen.add((repo, int(issue_id)))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f"State log error: {e}")
+    
+    def compact(self):
+        """Write the full set to a fresh snapshot and truncate the log."""
+        with self._lock:
+            try:
+                tmp_path = self.state_path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(sorted(self.seen), f)
+                os.replace(tmp_path, self.state_path)
+                # Replaying entries already in the snapshot is harmless, so truncating last is safe
+                if self._log:
+                    self._log.close()
+                self._log = open(self.log_path, 'w', encoding='utf-8')
+                self._log_entries = 0
+            except Exception as e:
+                logging.error(f"State compaction error: {e}")
+                if self._log is None or self._log.closed:
+                    self._log = open(self.log_path, 'a', encoding='utf-8')
+    
+    def close(self):
+        """Close the append-only log."""
+        with self._lock:
+            if self._log:
+                self._log.close()
     
     def is_issue_tracked(self, issue_id: int, repository: str) -> bool:
         """Check if an issue is already tracked."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            'SELECT 1 FROM tracked_issues WHERE issue_id = ? AND repository = ?',
-            (issue_id, repository)
-        )
-        
-        result = cursor.fetchone()
-        conn.close()
-        return result is not None
+        return (repository, issue_id) in self.seen
+    
+    def filter_untracked(self, repository: str, issue_ids: List[int]) -> Set[int]:
+        """Return the subset of issue IDs not yet tracked for a repository."""
+        return {issue_id for issue_id in issue_ids if (repository, issue_id) not in self.seen}
     
     def add_issue(self, issue: Issue):
         """Add a new issue to tracking."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO tracked_issues (issue_id, repository, created_at)
-                VALUES (?, ?, ?)
-            ''', (issue.id, issue.repository, issue.created_at))
-            conn.commit()
-        except Exception as e:
-            logging.error(f"Database error: {e}")
-        finally:
-            conn.close()
+        self.add_issues([issue])
+    
+    def add_issues(self, issues: List[Issue]):
+        """Add several issues to tracking with a single log write."""
+        with self._lock:
+            keys = dict.fromkeys((issue.repository, issue.id) for issue in issues)
+            new_keys = [key for key in keys if key not in self.seen]
+            if not new_keys:
+                return
+            self.seen.update(new_keys)
+            try:
+                self._log.write(''.join(f"{repo}\t{issue_id}\n" for repo, issue_id in new_keys))
+                self._log.flush()
+                self._log_entries += len(new_keys)
+            except Exception as e:
+                logging.error(f"State log error: {e}")
+                return
+        if self._log_entries >= self.COMPACT_THRESHOLD:
+            self.compact()
+
+# Warn when fewer GitHub API requests than this remain in the current window
+RATE_LIMIT_LOW_WATERMARK = 50
+# Retries for 5xx responses (exponential backoff with jitter)
+GITHUB_MAX_RETRIES = 3
+# Cooldown after a 403/429 when GitHub sends no reset time, in seconds
+DEFAULT_RATE_LIMIT_COOLDOWN = 60
+# Fields requested per repository in the batched GraphQL query (mirrors the REST parameters)
+GRAPHQL_ISSUES_SELECTION = """
+    issues(first: 20, filterBy: {since: $since, states: [OPEN]}, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        databaseId number title url createdAt
+        author { login }
+        labels(first: 6) { nodes { name } }
+      }
+    }
+"""
 
 class GitHubAPI:
-    def __init__(self, token: str = ""):
+    def __init__(self, session: aiohttp.ClientSession, token: str = ""):
+        self.session = session
         self.token = token
         self.base_url = "https://api.github.com"
+        self.graphql_url = f"{self.base_url}/graphql"
         # GitHub allows higher rate limits for public repos even without token
         self.headers = {
             'Accept': 'application/vnd.github.v3+json',
@@ -166,41 +234,211 @@ class GitHubAPI:
         # Add token if provided (recommended for higher rate limits)
         if self.token:
             self.headers['Authorization'] = f'token {self.token}'
-    
-    async def get_recent_issues(self, repository: str, since_minutes: int = 10) -> List[Issue]:
-        """Fetch recent issues from a public repository."""
-        since_time = (datetime.utcnow() - timedelta(minutes=since_minutes)).isoformat() + 'Z'
         
-        url = f"{self.base_url}/repos/{repository}/issues"
-        params = {
+        # Request pieces that never change between polls
+        self._base_params = {
             'state': 'open',
-            'since': since_time,
             'sort': 'created',
             'direction': 'desc',
             'per_page': 20  # Reduced for efficiency
         }
+        self._repo_urls: Dict[str, str] = {}
         
+        # Conditional requests: 304 responses are free against the rate limit
+        self._etags: Dict[str, str] = {}
+        self._last_issues: Dict[str, List[Issue]] = {}
+        # Latest rate-limit state reported by GitHub, per quota resource ("core" for REST, "graphql")
+        self.rate_limits: Dict[str, Tuple[int, float]] = {}
+        # Per-repository "do not call before" timestamps after a 403/429
+        self._cooldown_until: Dict[str, float] = {}
+    
+    def _start_cooldown(self, repository: str, response: aiohttp.ClientResponse):
+        """Pause polling a repository until GitHub's rate-limit window resets."""
+        reset = response.headers.get('X-RateLimit-Reset')
+        retry_after = response.headers.get('Retry-After')
         try:
-            timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=self.headers, params=params) as response:
-                    if response.status == 200:
-                        issues_data = await response.json()
+            if retry_after is not None:
+                until = time.time() + float(retry_after)
+            elif reset is not None:
+                until = float(reset)
+            else:
+                until = time.time() + DEFAULT_RATE_LIMIT_COOLDOWN
+        except ValueError:
+            until = time.time() + DEFAULT_RATE_LIMIT_COOLDOWN
+        self._cooldown_until[repository] = until
+        logging.warning(f"Rate limit hit for {repository}, pausing for {max(0, int(until - time.time()))}s")
+    
+    @staticmethod
+    def _is_rate_limited(response: aiohttp.ClientResponse) -> bool:
+        """Whether a 403 is a (primary or secondary) rate limit rather than a permission error."""
+        return (response.headers.get('Retry-After') is not None
+                or response.headers.get('X-RateLimit-Remaining') == '0')
+    
+    def _update_rate_limit(self, response: aiohttp.ClientResponse, default_resource: str):
+        """Record X-RateLimit-* headers under the quota resource they belong to."""
+        resource = response.headers.get('X-RateLimit-Resource', default_resource)
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        try:
+            self.rate_limits[resource] = (int(remaining), float(reset))
+        except ValueError:
+            return
+        if int(remaining) < RATE_LIMIT_LOW_WATERMARK:
+            logging.warning(f"GitHub {resource} rate limit low: {remaining} requests left")
+    
+    def _quota_exhausted(self, resource: str) -> bool:
+        """Whether a quota resource is used up and its window has not reset yet."""
+        remaining, reset = self.rate_limits.get(resource, (None, 0.0))
+        return remaining == 0 and time.time() < reset
+    
+    @staticmethod
+    def _since_timestamp(since_minutes: int) -> str:
+        """ISO-8601 UTC timestamp for "since_minutes ago"."""
+        return (datetime.utcnow() - timedelta(minutes=since_minutes)).isoformat() + 'Z'
+    
+    async def graphql_recent_issues(self, repositories: List[str], since_minutes: int = 10) -> Optional[Dict[str, List[Issue]]]:
+        """Fetch recent issues for many repositories in a single GraphQL request.
+
+        Returns None when GraphQL is unavailable (no token) or the request fails,
+        so callers can fall back to per-repository REST polling. Repositories whose
+        part of the query failed for reasons other than NOT_FOUND are left out of
+        the result for the same reason.
+        """
+        if not self.token or not repositories:
+            return None
+        # GraphQL has its own quota; wait for its reset rather than re-posting every cycle
+        if self._quota_exhausted('graphql'):
+            logging.debug("Skipping GraphQL: rate limit exhausted, using REST")
+            return None
+        
+        aliases = {}
+        subqueries = []
+        for i, repository in enumerate(repositories):
+            owner, _, name = repository.partition('/')
+            alias = f"r{i}"
+            aliases[alias] = repository
+            subqueries.append(
+                f"{alias}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{"
+                f"{GRAPHQL_ISSUES_SELECTION}}}"
+            )
+        payload = {
+            'query': f"query($since: DateTime!) {{ {' '.join(subqueries)} }}",
+            'variables': {'since': self._since_timestamp(since_minutes)},
+        }
+        
+        try:
+            async with self.session.post(self.graphql_url, headers=self.headers, json=payload) as response:
+                self._update_rate_limit(response, 'graphql')
+                if response.status in (403, 429) and response.headers.get('Retry-After') is not None:
+                    # Secondary limit: honour Retry-After for the GraphQL resource only
+                    try:
+                        retry_after = float(response.headers['Retry-After'])
+                    except ValueError:
+                        retry_after = DEFAULT_RATE_LIMIT_COOLDOWN
+                    self.rate_limits['graphql'] = (0, time.time() + retry_after)
+                if response.status != 200:
+                    logging.warning(f"GraphQL HTTP {response.status}, falling back to REST")
+                    return None
+                body = orjson.loads(await response.read())
+        except asyncio.TimeoutError:
+            logging.warning("Timeout fetching issues via GraphQL, falling back to REST")
+            return None
+        except Exception as e:
+            logging.error(f"Error fetching issues via GraphQL: {str(e)}")
+            return None
+        
+        data = body.get('data')
+        if not data:
+            logging.warning(f"GraphQL errors, falling back to REST: {body.get('errors')}")
+            return None
+        
+        # Failed aliases come back as null, with an error whose path starts with the alias
+        error_types: Dict[str, Set[str]] = {}
+        for error in body.get('errors') or []:
+            path = error.get('path') or []
+            if path:
+                error_types.setdefault(path[0], set()).add(error.get('type', ''))
+        
+        results: Dict[str, List[Issue]] = {}
+        for alias, repository in aliases.items():
+            repo_data = data.get(alias)
+            if repo_data is None:
+                if 'NOT_FOUND' in error_types.get(alias, ()):
+                    logging.error(f"Repository {repository} not found or private")
+                    results[repository] = []
+                else:
+                    # Transient or permission failure: leave it out so the caller polls it via REST
+                    logging.warning(f"GraphQL failed for {repository} ({error_types.get(alias)}), using REST")
+                continue
+            results[repository] = [
+                self._parse_graphql_issue(node, repository)
+                for node in repo_data['issues']['nodes'] if node
+            ]
+        return results
+    
+    async def get_recent_issues(self, repository: str, since_minutes: int = 10) -> List[Issue]:
+        """Fetch recent issues from a public repository."""
+        since_time = self._since_timestamp(since_minutes)
+        
+        url = self._repo_urls.get(repository)
+        if url is None:
+            url = self._repo_urls[repository] = f"{self.base_url}/repos/{repository}/issues"
+        params = {**self._base_params, 'since': since_time}
+        
+        # Back off until the reset time once the quota is exhausted or this repo was rate limited
+        if self._quota_exhausted('core'):
+            logging.debug(f"Skipping {repository}: rate limit exhausted")
+            return []
+        if time.time() < self._cooldown_until.get(repository, 0):
+            logging.debug(f"Skipping {repository}: cooling down after rate limit")
+            return []
+        
+        headers = self.headers
+        etag = self._etags.get(repository)
+        if etag:
+            headers = {**self.headers, 'If-None-Match': etag}
+        
+        try:
+            for attempt in range(GITHUB_MAX_RETRIES + 1):
+                async with self.session.get(url, headers=headers, params=params) as response:
+                    self._update_rate_limit(response, 'core')
+                    if response.status == 304:
+                        # Unchanged since last poll; the state store filters already-notified issues
+                        return self._last_issues.get(repository, [])
+                    elif response.status == 200:
+                        issues_data = orjson.loads(await response.read())
                         # Filter out pull requests and parse issues
                         issues = []
                         for issue_data in issues_data:
                             if not issue_data.get('pull_request'):  # Exclude PRs
                                 issues.append(self._parse_issue(issue_data, repository))
+                        new_etag = response.headers.get('ETag')
+                        if new_etag:
+                            self._etags[repository] = new_etag
+                            self._last_issues[repository] = issues
                         return issues
+                    elif response.status == 429 or (response.status == 403 and self._is_rate_limited(response)):
+                        self._start_cooldown(repository, response)
+                        return []
                     elif response.status == 403:
-                        logging.warning(f"Rate limit hit for {repository}")
+                        # Quota left and no Retry-After: a permission/blocked 403, not a rate limit
+                        logging.warning(f"HTTP 403 for {repository}")
                         return []
                     elif response.status == 404:
                         logging.error(f"Repository {repository} not found or private")
                         return []
-                    else:
+                    elif response.status < 500 or attempt == GITHUB_MAX_RETRIES:
                         logging.warning(f"HTTP {response.status} for {repository}")
                         return []
+                    status = response.status
+                
+                # Server error: retry with exponential backoff plus jitter
+                delay = 2 ** attempt + random.random()
+                logging.warning(f"HTTP {status} for {repository}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            return []
         except asyncio.TimeoutError:
             logging.warning(f"Timeout fetching issues for {repository}")
             return []
@@ -210,11 +448,11 @@ class GitHubAPI:
     
     def _parse_issue(self, issue_data: dict, repository: str) -> Issue:
         """Parse GitHub API issue data."""
-        labels = []
+        labels = ()
         try:
-            labels = [lbl.get('name', '') for lbl in issue_data.get('labels', []) if isinstance(lbl, dict)]
+            labels = tuple(lbl.get('name', '') for lbl in issue_data.get('labels', []) if isinstance(lbl, dict))
         except Exception:
-            labels = []
+            labels = ()
         return Issue(
             id=issue_data['id'],
             number=issue_data['number'],
@@ -225,9 +463,24 @@ class GitHubAPI:
             author=issue_data['user']['login'],
             labels=labels,
         )
+    
+    def _parse_graphql_issue(self, node: dict, repository: str) -> Issue:
+        """Parse a GraphQL issue node (databaseId matches the REST issue id)."""
+        author = node.get('author') or {}
+        return Issue(
+            id=node['databaseId'],
+            number=node['number'],
+            title=node['title'],
+            url=node['url'],
+            created_at=node['createdAt'],
+            repository=repository,
+            author=author.get('login', 'ghost'),
+            labels=tuple(lbl['name'] for lbl in (node.get('labels') or {}).get('nodes', []) if lbl),
+        )
 
 class TelegramBot:
-    def __init__(self, bot_token: str, chat_id: str):
+    def __init__(self, session: aiohttp.ClientSession, bot_token: str, chat_id: str):
+        self.session = session
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
@@ -245,35 +498,46 @@ class TelegramBot:
         }
         
         try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=data) as response:
+            # Send immediately; on 429 wait exactly as long as Telegram asks, then retry once
+            for attempt in range(2):
+                async with self.session.post(url, json=data) as response:
                     if response.status == 200:
                         return True
+                    elif response.status == 429 and attempt == 0:
+                        retry_after = await self._retry_after(response)
+                        logging.warning(f"Telegram rate limit hit, retrying in {retry_after}s")
                     else:
                         logging.error(f"Telegram API error: {response.status}")
                         return False
+                await asyncio.sleep(retry_after)
+            return False
         except Exception as e:
             logging.error(f"Error sending Telegram message: {str(e)}")
             return False
     
+    async def _retry_after(self, response: aiohttp.ClientResponse) -> float:
+        """Read the back-off delay from a Telegram 429 response."""
+        try:
+            body = await response.json(content_type=None)
+            return float(body['parameters']['retry_after'])
+        except Exception:
+            return float(response.headers.get('Retry-After', 1))
+    
     def format_issue_notification(self, issue: Issue) -> str:
         """Format issue into clean chat-style notification."""
-        # Clean title for HTML
-        title = issue.title.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-        
-        # Truncate very long titles
+        # Truncate very long titles before escaping so entities are never cut in half
+        title = issue.title
         if len(title) > 80:
             title = title[:77] + "..."
-        # Labels (escaped and truncated per label)
+        title = html.escape(title, quote=False)
+        
+        # Labels (truncated and escaped per label, show up to 6)
         labels_line = ""
         if issue.labels:
-            safe_labels = []
-            for name in issue.labels[:6]:  # show up to 6 labels
-                safe = name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                if len(safe) > 20:
-                    safe = safe[:17] + "..."
-                safe_labels.append(f"<code>{safe}</code>")
+            safe_labels = [
+                f"<code>{html.escape(name if len(name) <= 20 else name[:17] + '...', quote=False)}</code>"
+                for name in issue.labels[:6]
+            ]
             labels_line = "\n🏷️ <b>Labels:</b> " + ", ".join(safe_labels)
         
         message = f"""🆕 <b>New Issue</b>
@@ -288,9 +552,13 @@ class TelegramBot:
 class CNCFIssueTracker:
     def __init__(self, config: Config):
         self.config = config
-        self.github = GitHubAPI(config.github_token)
-        self.telegram = TelegramBot(config.telegram_bot_token, config.telegram_chat_id)
-        self.db = Database(config.db_path)
+        self.store = StateStore(config.state_path)
+        # Look-back window per poll: check interval plus buffer time (config is fixed for the run)
+        self.check_minutes = max(5, int(config.check_interval / 60) + config.check_buffer_minutes)
+        # HTTP clients share one pooled session, created in start() inside the event loop
+        self.session = None
+        self.github = None
+        self.telegram = None
         
         # Setup logging
         logging.basicConfig(
@@ -299,37 +567,46 @@ class CNCFIssueTracker:
             handlers=[logging.StreamHandler()]
         )
         self.logger = logging.getLogger(__name__)
-        # Propagate API timeout to GitHub client
-        self.github.timeout_seconds = self.config.api_timeout
+
+    async def start(self):
+        """Open the shared HTTP session and attach the API clients to it."""
+        self.session = create_session(self.config.api_timeout)
+        self.github = GitHubAPI(self.session, self.config.github_token)
+        self.telegram = TelegramBot(self.session, self.config.telegram_bot_token, self.config.telegram_chat_id)
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self.session and not self.session.closed:
+            await self.session.close()
     
     async def check_all_repositories(self):
         """Check all repositories for new issues."""
         self.logger.info(f"🔍 Checking {len(self.config.repositories)} repositories...")
         
         new_issues_count = 0
-        check_minutes = max(5, int(self.config.check_interval / 60) + self.config.check_buffer_minutes)  # Buffer time
         
-        # Process repositories in batches to avoid overwhelming APIs
-        batch_size = max(1, self.config.batch_size)
-        for i in range(0, len(self.config.repositories), batch_size):
-            batch = self.config.repositories[i:i + batch_size]
-            
-            tasks = []
-            for repo in batch:
-                tasks.append(self.check_repository(repo, check_minutes))
-            
-            # Wait for batch to complete
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in batch_results:
-                if isinstance(result, int):
-                    new_issues_count += result
-                elif isinstance(result, Exception):
-                    self.logger.error(f"Batch error: {result}")
-            
-            # Small delay between batches
-            if i + batch_size < len(self.config.repositories):
-                await asyncio.sleep(max(0, self.config.batch_delay))
+        # Check all repositories concurrently, capped by a semaphore to avoid overwhelming APIs
+        semaphore = asyncio.Semaphore(max(1, self.config.concurrency))
+        
+        # With a token, one GraphQL request covers every repository; otherwise poll REST per repository
+        issues_by_repo = await self.github.graphql_recent_issues(self.config.repositories, self.check_minutes)
+        
+        async def guarded(repo: str) -> int:
+            async with semaphore:
+                # Repositories missing from the GraphQL result are fetched via REST
+                prefetched = issues_by_repo.get(repo) if issues_by_repo is not None else None
+                return await self.check_repository(repo, self.check_minutes, prefetched)
+        
+        results = await asyncio.gather(
+            *(guarded(repo) for repo in self.config.repositories),
+            return_exceptions=True
+        )
+        
+        for result in results:
+            if isinstance(result, int):
+                new_issues_count += result
+            elif isinstance(result, Exception):
+                self.logger.error(f"Repository check error: {result}")
         
         if new_issues_count > 0:
             self.logger.info(f"✅ Found {new_issues_count} new issues")
@@ -338,23 +615,32 @@ class CNCFIssueTracker:
         
         return new_issues_count
     
-    async def check_repository(self, repository: str, since_minutes: int) -> int:
-        """Check a single repository for new issues."""
+    async def check_repository(self, repository: str, since_minutes: int,
+                               recent_issues: Optional[List[Issue]] = None) -> int:
+        """Check a single repository for new issues (fetching them unless already provided)."""
         try:
-            recent_issues = await self.github.get_recent_issues(repository, since_minutes)
+            if recent_issues is None:
+                recent_issues = await self.github.get_recent_issues(repository, since_minutes)
             new_count = 0
             
-            for issue in recent_issues:
-                if not self.db.is_issue_tracked(issue.id, issue.repository):
-                    # New issue found!
-                    success = await self.notify_new_issue(issue)
-                    if success:
-                        self.db.add_issue(issue)
-                        new_count += 1
-                        self.logger.info(f"📢 Notified: {repository}#{issue.number}")
-                    
-                    # Rate limiting delay
-                    await asyncio.sleep(max(0, self.config.notification_delay))
+            # Single lookup for the whole page instead of one query per issue
+            untracked_ids = self.store.filter_untracked(repository, [issue.id for issue in recent_issues])
+            
+            # Notified issues are recorded in one batch once the loop finishes; the write
+            # (and any compaction) runs in a worker thread so other repositories keep sending
+            notified = []
+            try:
+                for issue in recent_issues:
+                    if issue.id in untracked_ids:
+                        # New issue found!
+                        success = await self.notify_new_issue(issue)
+                        if success:
+                            notified.append(issue)
+                            new_count += 1
+                            self.logger.info(f"📢 Notified: {repository}#{issue.number}")
+            finally:
+                if notified:
+                    await asyncio.get_running_loop().run_in_executor(None, self.store.add_issues, notified)
             
             return new_count
             
@@ -388,6 +674,15 @@ Bot is now monitoring for new issues! 🎯"""
         """Main monitoring loop."""
         self.logger.info("🤖 Starting CNCF Issue Tracker Bot...")
         
+        await self.start()
+        try:
+            await self._run_loop()
+        finally:
+            await self.close()
+            self.store.close()
+    
+    async def _run_loop(self):
+        """Send the startup notification and poll repositories forever."""
         # Send startup notification
         startup_success = await self.send_startup_notification()
         if not startup_success:
@@ -434,7 +729,7 @@ def main():
     print(f"   • Repositories: {len(config.repositories)}")
     print(f"   • GitHub token: {'✅ Configured' if config.github_token else '❌ Not set (using public API)'}")
     print(f"   • Telegram: ✅ Configured")
-    print(f"   • Database path: {config.db_path}")
+    print(f"   • State path: {config.state_path}")
     print(f"   • Log level: {config.log_level}")
     
     # Start the tracker
@@ -15,23 +15,20 @@ REPOSITORIES = [
     "antrea-io/antrea "
 ]
 
+# Strip whitespace and drop duplicates (keeps order) so no repository is polled twice
+REPOSITORIES = list(dict.fromkeys(r.strip() for r in REPOSITORIES if r.strip()))
+
 # Check interval in seconds (60-240 seconds = 1-4 minutes)
 DEFAULT_CHECK_INTERVAL = 180  # 3 minutes
 
-# Database file path
-DATABASE_PATH = "cncf_issues.db"
+# Tracked-issue state file path (an append-only ".log" file is kept next to it)
+STATE_PATH = "state.json"
 
 # Logging level (DEBUG, INFO, WARNING, ERROR)
 LOG_LEVEL = "INFO"
 
-# Batch size for processing repositories (to avoid overwhelming APIs)
-BATCH_SIZE = 3
-
-# Delay between batches in seconds
-BATCH_DELAY = 2
-
-# Rate limiting delay between issue notifications in seconds
-NOTIFICATION_DELAY = 1
+# Maximum number of repositories checked concurrently (to avoid overwhelming APIs)
+CONCURRENCY = 5
 
 # Timeout for API requests in seconds
 API_TIMEOUT = 10
@@ -42,8 +42,8 @@ echo "   • TELEGRAM_BOT_TOKEN=<your_telegram_bot_token>"
 echo "   • TELEGRAM_CHAT_ID=<your_chat_id>"
 echo "   • CHECK_INTERVAL=180 (or your preferred interval)"
 echo "   • GITHUB_TOKEN=<your_github_personal_access_token> (optional but recommended)"
-echo "   • Optional: LOG_LEVEL=INFO, BATCH_SIZE=3, BATCH_DELAY=2, NOTIFICATION_DELAY=1"
-echo "   • If you attach a persistent volume: DB_PATH=/data/cncf_issues.db"
+echo "   • Optional: LOG_LEVEL=INFO, CONCURRENCY=5"
+echo "   • If you attach a persistent volume: STATE_PATH=/data/state.json"
 echo ""
 echo "🎉 Your bot will be deployed and start monitoring repositories!"
 echo ""
@@ -7,7 +7,7 @@ Tests configuration and Telegram connection locally.
 import os
 import asyncio
 import sys
-from cncf_issue_tracker import Config, TelegramBot, CNCFIssueTracker
+from cncf_issue_tracker import Config, TelegramBot, CNCFIssueTracker, create_session
 
 async def test_telegram_connection():
     """Test Telegram bot connection."""
@@ -19,8 +19,6 @@ async def test_telegram_connection():
         print("❌ Error: Telegram credentials not configured")
         return False
     
-    bot = TelegramBot(config.telegram_bot_token, config.telegram_chat_id)
-    
     # Test message
     test_message = """🧪 <b>Test Message</b>
 
@@ -30,7 +28,9 @@ This is a test message from your CNCF Issue Tracker Bot.
 🎯 Ready to monitor repositories for new issues."""
     
     try:
-        success = await bot.send_message(test_message)
+        async with create_session(config.api_timeout) as session:
+            bot = TelegramBot(session, config.telegram_bot_token, config.telegram_chat_id)
+            success = await bot.send_message(test_message)
         if success:
             print("✅ Telegram connection successful! Check your Telegram chat.")
             return True
@@ -52,7 +52,7 @@ async def test_configuration():
     print(f"   • GitHub token: {'✅ Configured' if config.github_token else '❌ Not set (using public API)'}")
     print(f"   • Telegram token: {'✅ Configured' if config.telegram_bot_token else '❌ Not set'}")
     print(f"   • Telegram chat ID: {'✅ Configured' if config.telegram_chat_id else '❌ Not set'}")
-    print(f"   • Database path: {config.db_path}")
+    print(f"   • State path: {config.state_path}")
     
     print("\n📦 Repositories to monitor:")
     for i, repo in enumerate(config.repositories, 1):
@@ -76,10 +76,11 @@ async def test_github_api():
     
     try:
         from cncf_issue_tracker import GitHubAPI
-        github = GitHubAPI(config.github_token)
-        
-        # Test API call
-        issues = await github.get_recent_issues(test_repo, since_minutes=60)
+        async with create_session(config.api_timeout) as session:
+            github = GitHubAPI(session, config.github_token)
+            
+            # Test API call
+            issues = await github.get_recent_issues(test_repo, since_minutes=60)
         print(f"   • API call successful: {len(issues)} recent issues found")
         return True
         